@@ -3,10 +3,15 @@
 Quick test to verify AI Email Agent setup
 """
 import os
-import subprocess
+import re
 import sys
+from importlib.metadata import distributions
 from pathlib import Path
 
+# Matches the distribution name at the start of a requirement line,
+# e.g. "fastapi", "uvicorn[standard]>=0.23", "python-dotenv==1.0.0"
+REQUIREMENT_NAME = re.compile(r"^([A-Za-z0-9][A-Za-z0-9._-]*)")
+
 def check_directory_structure():
     """Check if all directories and files exist."""
     print("🔍 Checking directory structure...")
@@ -35,10 +40,18 @@ def check_directory_structure():
         "docker-compose.yml"
     ]
 
+    # Build a set of everything under the base path in one traversal,
+    # then check the required entries with set lookups instead of
+    # one stat() call per entry.
+    present = set()
+    for root, dirs, files in os.walk(base_path):
+        rel = os.path.relpath(root, base_path)
+        for entry in dirs + files:
+            present.add(entry if rel == "." else f"{rel}/{entry}")
+
     # Check directories
     for dir_path in required_dirs:
-        full_path = base_path / dir_path
-        if full_path.exists():
+        if dir_path in present:
             print(f"✅ {dir_path}/")
         else:
             print(f"❌ {dir_path}/ missing!")
@@ -46,8 +59,7 @@ def check_directory_structure():
 
     # Check files
     for file_path in required_files:
-        full_path = base_path / file_path
-        if full_path.exists():
+        if file_path in present:
             print(f"✅ {file_path}")
         else:
             print(f"❌ {file_path} missing!")
@@ -56,17 +68,31 @@ def check_directory_structure():
     return True
 
 def check_dependencies():
-    """Check if Python dependencies can be installed."""
+    """Check if Python dependencies are installed."""
     print("\n📦 Checking dependencies...")
 
     try:
-        result = subprocess.run([sys.executable, "-m", "pip", "install", "--dry-run", "-r", "ai-email-agent/requirements.txt"],
-                              capture_output=True, text=True, timeout=30)
-        if result.returncode == 0:
-            print("✅ All dependencies installable")
+        def normalize(name):
+            return re.sub(r"[-_.]+", "-", name).lower()
+
+        installed = {normalize(d.metadata["Name"]): d.version for d in distributions()
+                     if d.metadata["Name"]}
+
+        missing = []
+        for line in Path("ai-email-agent/requirements.txt").read_text().splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            match = REQUIREMENT_NAME.match(line)
+            if match and normalize(match.group(1)) not in installed:
+                missing.append(match.group(1))
+
+        if not missing:
+            print("✅ All dependencies installed")
             return True
         else:
-            print(f"❌ Dependency check failed: {result.stderr}")
+            print(f"❌ Missing dependencies: {', '.join(missing)}")
+            print("   Install them with: pip install -r ai-email-agent/requirements.txt")
             return False
     except Exception as e:
         print(f"❌ Dependency check error: {e}")